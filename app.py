@@ -1,39 +1,105 @@
-import dash
-from dash import html, dcc, Input, Output, dash_table
-import dash_bootstrap_components as dbc
-import pandas as pd
-from dash.dash_table.Format import Format, Scheme
-import plotly.graph_objects as go
+import time
+
+# 先于其余导入计时，使启动耗时包含 dash / dbc / flask 的导入
+START_TIME = time.perf_counter()
+
+import os  # noqa: E402
+import threading  # noqa: E402
+
+import dash  # noqa: E402
+from dash import html, dcc, Input, Output, dash_table  # noqa: E402
+from dash.dash_table.Format import Format, Scheme  # noqa: E402
+from dash.exceptions import PreventUpdate  # noqa: E402
+import dash_bootstrap_components as dbc  # noqa: E402
+from flask import jsonify  # noqa: E402
 
 FILE_PATH = "EXCEL_BI_ALLDATA.xlsx"
 SHEET_MASTER = "Master"
 SHEET_BUDGET = "项目预算数据（测试版本）"
 SHEET_ACTUAL = "项目实际数据（测试版本）"
 
-df_master = pd.read_excel(FILE_PATH, sheet_name=SHEET_MASTER)
-df_master.columns = df_master.columns.str.strip().str.replace("\n", "").str.replace(" ", "")
-df_master = df_master.fillna("-")
-df_projects = pd.DataFrame({
-    "项目编号": df_master["项目编号"],
-    "项目名称": df_master["项目名称"],
-    "产品经理": df_master["产品经理"],
-    "立项时间": df_master["立项时间"],
-    "结项预期": df_master["结项预期"],
-    "一级部门": df_master["一级部门"],
-    "二级部门": df_master["二级部门"],
-    "项目负责人": df_master["项目负责人"],
-    "项目经理": df_master["项目经理"],
-    "重点项目": df_master["重点项目"],
-    "状态": df_master["状态"],
-    "项目类型": df_master["项目类型TDP/PDP"]
-})
-
-df_budget_all = pd.read_excel(FILE_PATH, sheet_name=SHEET_BUDGET)
-df_actual_all = pd.read_excel(FILE_PATH, sheet_name=SHEET_ACTUAL)
-df_actual_all["SIPM125.SQSJ"] = pd.to_datetime(df_actual_all["SIPM125.SQSJ"], errors="coerce")
-df_actual_all["月份"] = df_actual_all["SIPM125.SQSJ"].dt.to_period("M")
+# 数据在后台线程中加载，加载完成前 /readyz 返回 503
+# pandas / plotly 在 load_data 中导入，就绪后再供回调使用
+pd = None
+go = None
+df_projects = None
+df_budget_all = None
+df_actual_all = None
+DATA_READY = threading.Event()
+DATA_ERROR = None
+TIME_TO_READY = None
+TIME_TO_FIRST_BYTE = None
+_LOADER = None
+
+def load_data():
+    """
+    读取 Excel 三张表并写入模块级 DataFrame，完成后设置 DATA_READY
+    """
+    global pd, go, df_projects, df_budget_all, df_actual_all, DATA_ERROR, TIME_TO_READY
+    try:
+        import pandas as pd
+        import plotly.graph_objects as go
+
+        df_master = pd.read_excel(FILE_PATH, sheet_name=SHEET_MASTER)
+        df_master.columns = df_master.columns.str.strip().str.replace("\n", "").str.replace(" ", "")
+        df_master = df_master.fillna("-")
+        projects = pd.DataFrame({
+            "项目编号": df_master["项目编号"],
+            "项目名称": df_master["项目名称"],
+            "产品经理": df_master["产品经理"],
+            "立项时间": df_master["立项时间"],
+            "结项预期": df_master["结项预期"],
+            "一级部门": df_master["一级部门"],
+            "二级部门": df_master["二级部门"],
+            "项目负责人": df_master["项目负责人"],
+            "项目经理": df_master["项目经理"],
+            "重点项目": df_master["重点项目"],
+            "状态": df_master["状态"],
+            "项目类型": df_master["项目类型TDP/PDP"]
+        })
+
+        budget_all = pd.read_excel(FILE_PATH, sheet_name=SHEET_BUDGET)
+        actual_all = pd.read_excel(FILE_PATH, sheet_name=SHEET_ACTUAL)
+        actual_all["SIPM125.SQSJ"] = pd.to_datetime(actual_all["SIPM125.SQSJ"], errors="coerce")
+        actual_all["月份"] = actual_all["SIPM125.SQSJ"].dt.to_period("M")
+    except Exception as exc:
+        DATA_ERROR = repr(exc)
+        print(f"Data load failed: {DATA_ERROR}", flush=True)
+        return
+
+    df_projects, df_budget_all, df_actual_all = projects, budget_all, actual_all
+    TIME_TO_READY = time.perf_counter() - START_TIME
+    DATA_READY.set()
+    print(f"Time to ready: {TIME_TO_READY:.3f}s", flush=True)
+
+def start_loading():
+    """
+    启动后台加载线程
+    """
+    global _LOADER
+    _LOADER = threading.Thread(target=load_data, name="load-data", daemon=True)
+    _LOADER.start()
+
+def _before_fork():
+    # 等加载线程结束再 fork，避免子进程继承导入到一半的 pandas / plotly
+    if _LOADER is not None:
+        _LOADER.join()
+
+def _after_fork_in_child():
+    # 线程不会随 fork 复制；子进程未继承到数据时重新加载
+    global DATA_READY, DATA_ERROR, TIME_TO_READY
+    if DATA_READY.is_set():
+        return
+    DATA_READY = threading.Event()
+    DATA_ERROR = None
+    TIME_TO_READY = None
+    start_loading()
+
+os.register_at_fork(before=_before_fork, after_in_child=_after_fork_in_child)
+start_loading()
 
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
+server = app.server
 app.title = "Project Dashboard"
 app.index_string = '''
 <!DOCTYPE html>
@@ -395,8 +461,9 @@ app.layout = dbc.Container([
             dbc.Col(
                 dcc.Dropdown(
                     id="project-selector",
-                    options=[{"label": pid, "value": pid} for pid in df_projects["项目编号"]],
-                    value=df_projects["项目编号"].iloc[0],
+                    options=[],
+                    value=None,
+                    placeholder="Loading data...",
                     style={"width": "200px", "fontSize": "14px", "borderRadius": "4px"},
                 ),
                 width="auto",
@@ -409,6 +476,7 @@ app.layout = dbc.Container([
         "borderRadius": "10px",
         "marginBottom": "25px"
     }),
+    dcc.Interval(id="ready-poll", interval=1000),
     html.Div(id="project-info"),
     dbc.Row([
          dbc.Col([
@@ -491,11 +559,50 @@ app.layout = dbc.Container([
     ], className="mt-4"),
 ], fluid=True, style={"padding": "2rem"})
 
+@server.after_request
+def record_first_byte(response):
+    global TIME_TO_FIRST_BYTE
+    if TIME_TO_FIRST_BYTE is None:
+        TIME_TO_FIRST_BYTE = time.perf_counter() - START_TIME
+        print(f"Time to first byte: {TIME_TO_FIRST_BYTE:.3f}s", flush=True)
+    return response
+
+@server.route("/healthz")
+def healthz():
+    return jsonify(status="live")
+
+@server.route("/readyz")
+def readyz():
+    timings = {"time_to_first_byte": TIME_TO_FIRST_BYTE, "time_to_ready": TIME_TO_READY}
+    if DATA_READY.is_set():
+        return jsonify(status="ready", **timings)
+    if DATA_ERROR is not None:
+        return jsonify(status="error", error=DATA_ERROR, **timings), 503
+    return jsonify(status="loading", **timings), 503
+
+@app.callback(
+    Output("project-selector", "options"),
+    Output("project-selector", "value"),
+    Output("project-selector", "placeholder"),
+    Output("ready-poll", "disabled"),
+    Input("ready-poll", "n_intervals")
+)
+def populate_project_selector(_):
+    if not DATA_READY.is_set():
+        if DATA_ERROR is not None:
+            return [], None, "Data failed to load", True
+        raise PreventUpdate
+    project_ids = df_projects["项目编号"]
+    options = [{"label": pid, "value": pid} for pid in project_ids]
+    return options, project_ids.iloc[0], "Select a project", True
+
 @app.callback(
     Output("project-info", "children"),
     Input("project-selector", "value")
 )
 def update_project_info(project_id):
+    if project_id is None or not DATA_READY.is_set():
+        raise PreventUpdate
     row = df_projects[df_projects["项目编号"] == project_id].iloc[0]
     return build_project_info(row)
 @app.callback(
@@ -506,6 +613,8 @@ def update_project_info(project_id):
     Input("project-selector", "value")
 )
 def update_otd_tables(project_id):
+    if project_id is None or not DATA_READY.is_set():
+        raise PreventUpdate
     df_summary, df_detail, _ = get_otd_table_data(project_id)
     summary_columns = [
         {"name": "Expense Category", "id": "费用大类", "type": "text"},
@@ -541,6 +650,8 @@ def update_otd_tables(project_id):
     Input("project-selector", "value")
 )
 def update_budget_overview(project_id):
+    if project_id is None or not DATA_READY.is_set():
+        raise PreventUpdate
     df_summary, df_detail, df_monthly = get_otd_table_data(project_id)
     total_budget = df_summary["预算金额"].replace("-", 0).astype(float).sum()
     total_actual = df_summary["实际金额"].replace("-", 0).astype(float).sum()
@@ -573,7 +684,8 @@ def update_budget_overview(project_id):
     Input("project-selector", "value")
 )
 def update_matrix(project_id):
-
+    if project_id is None or not DATA_READY.is_set():
+        raise PreventUpdate
     df_summary, df_detail, _ = get_otd_table_data(project_id)
     project_type = df_projects[df_projects["项目编号"] == project_id]["项目类型"].values[0]
     stages = ["R0", "R1", "R2", "R3", "R4", "R5"] if project_type == "TDP" else \